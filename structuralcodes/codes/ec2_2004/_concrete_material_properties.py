@@ -1,7 +1,12 @@
 """Concrete material properties according to Tab. 3.1."""
 
+from __future__ import annotations  # To have clean hints of ArrayLike in docs
+
 import math
 
+import numpy as np
+import numpy.typing as npt
+
 from structuralcodes.codes import mc2010
 
 
@@ -67,18 +72,21 @@ def fctk_95(fctm: float) -> float:
     return mc2010.fctkmax(fctm=abs(fctm))
 
 
-def Ecm(fcm: float) -> float:
+def Ecm(fcm: npt.ArrayLike) -> npt.ArrayLike:
     """The secant modulus of concrete.
 
     EN 1992-1-1:2004, Table 3.1.
 
     Args:
-        fcm (float): The mean compressive strength of concrete in MPa.
+        fcm (npt.ArrayLike): The mean compressive strength of concrete in MPa.
 
     Returns:
-        float: The secant modulus of concrete in MPa.
+        npt.ArrayLike: The secant modulus of concrete in MPa.
     """
-    return 22000.0 * math.pow(abs(fcm) / 10, 0.3)
+    if np.isscalar(fcm):
+        return 22000.0 * math.pow(abs(fcm) / 10, 0.3)
+    fcm = np.atleast_1d(fcm)
+    return 22000.0 * np.power(np.abs(fcm) / 10, 0.3)
 
 
 def eps_c1(fcm: float) -> float:
@@ -19,7 +19,9 @@ def _k(d: float) -> float:
         float: Correction factor to account for the cross-sectional size on the
         shear resistance.
     """
-    return min(1.0 + math.sqrt(200.0 / d), 2.0)
+    # For 0 < d <= 200 mm the factor is capped at 2.0, non-positive depths
+    # fall through to the sqrt and raise
+    return 2.0 if 0 < d <= 200.0 else 1.0 + math.sqrt(200.0 / d)
 
 
 # Part of Equation (6.2).
@@ -203,11 +205,16 @@ def VRdc(
         float: The concrete shear resistance in MPa.
     """
     CRdc = CRdc or 0.18 / gamma_c
+    # The prestress term is common to VRdc and VRdcmin
     return (
-        max(
-            CRdc * _k(d) * (100 * _rho_L(Asl, bw, d) * fck) ** (1.0 / 3.0)
-            + k1 * _sigma_cp(NEd, Ac, fcd),  # VRdc
-            vmin(fck, d) + k1 * _sigma_cp(NEd, Ac, fcd),  # VRdcmin
+        (
+            max(
+                CRdc
+                * _k(d)
+                * (100 * _rho_L(Asl, bw, d) * fck) ** (1.0 / 3.0),  # VRdc
+                vmin(fck, d),  # VRdcmin
+            )
+            + k1 * _sigma_cp(NEd, Ac, fcd)
         )
         * bw
         * d
@@ -2,6 +2,7 @@
 
 import math
 
+import numpy as np
 import pytest
 
 from structuralcodes.codes.ec2_2004 import _concrete_material_properties
@@ -147,6 +148,13 @@ def test_Ecm(test_input, expect):
     )
 
 
+def test_Ecm_array():
+    """Test the Ecm function with an array of strengths."""
+    fcm = np.array([20.0, 38.0, 58.0, 98.0])
+    expected = [_concrete_material_properties.Ecm(f) for f in fcm]
+    assert np.allclose(_concrete_material_properties.Ecm(fcm), expected)
+
+
 @pytest.mark.parametrize(
     'test_input, expect',
     [
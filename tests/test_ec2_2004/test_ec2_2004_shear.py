@@ -30,6 +30,19 @@ def test_k(d, expected):
     assert math.isclose(_k(d), expected, rel_tol=0.01)
 
 
+@pytest.mark.parametrize(
+    'd, expected_error',
+    [
+        (0, ZeroDivisionError),
+        (-5, ValueError),
+    ],
+)
+def test_k_invalid_depth(d, expected_error):
+    """Test that _k raises for non-positive depths."""
+    with pytest.raises(expected_error):
+        _k(d)
+
+
 @pytest.mark.parametrize(
     'Asl, bw, d, expected',
     [